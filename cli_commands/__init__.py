@@ -0,0 +1,7 @@
+"""
+CLI subcommand modules.
+
+Each module here holds one click command and is imported lazily by the
+LazyGroup in cli.py, so invoking (or tab-completing) one subcommand
+never pays the import cost of the others.
+"""
@@ -0,0 +1,93 @@
+"""Batch integrated analysis subcommand."""
+
+import asyncio
+from pathlib import Path
+from typing import Optional
+import click
+
+import utils_cache
+
+
+@click.command()
+@click.option('--input-file', '-i', required=True, help='Text file with one prompt per line')
+@click.option('--profile', required=True, help='User profile JSON file path or JSON string')
+@click.option('--model', '-m', default='qwen3:0.6b', help='Model name')
+@click.option('--backend', '-b', default='ollama',
+              type=click.Choice(['ollama', 'huggingface']), help='Model backend')
+@click.option('--max-concurrency', default=4, help='Maximum concurrent analyses')
+@click.option('--output-dir', '-o', help='Directory for per-prompt result files')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def batch(input_file: str, profile: str, model: str, backend: str,
+          max_concurrency: int, output_dir: Optional[str], verbose: bool):
+    """Run integrated analysis for a batch of prompts under one event loop"""
+    try:
+        from deepconf_with_behavior import create_integrated_analyzer
+    except ImportError:
+        click.echo("❌ Integrated analysis functionality unavailable, please check related dependencies", err=True)
+        return
+
+    try:
+        # Parse user profile (file-backed profiles are cached by mtime+size)
+        profile_data = utils_cache.load_profile(profile)
+
+        # Read prompts
+        with open(input_file, 'r', encoding='utf-8') as f:
+            prompts = [line.strip() for line in f if line.strip()]
+
+        if not prompts:
+            click.echo("❌ No prompts found in input file", err=True)
+            return
+
+        if verbose:
+            click.echo(f"📦 Starting batch analysis of {len(prompts)} prompts...")
+            click.echo(f"   Model: {model}")
+            click.echo(f"   Backend: {backend}")
+            click.echo(f"   Max concurrency: {max_concurrency}")
+
+        # Create analyzer once and dispatch all prompts concurrently on
+        # a single event loop
+        analyzer = create_integrated_analyzer(
+            model_backend=backend,
+            model_name=model
+        )
+
+        async def run_batch():
+            try:
+                return await analyzer.integrated_analysis_batch(
+                    prompts,
+                    [profile_data] * len(prompts),
+                    max_concurrency=max_concurrency
+                )
+            finally:
+                await analyzer.aclose()
+
+        results = asyncio.run(run_batch())
+
+        # Output results
+        if output_dir:
+            out_path = Path(output_dir)
+            out_path.mkdir(parents=True, exist_ok=True)
+
+        succeeded = 0
+        for i, (prompt, result) in enumerate(zip(prompts, results), 1):
+            if isinstance(result, Exception):
+                click.echo(f"❌ Prompt {i} failed: {result}", err=True)
+                continue
+
+            succeeded += 1
+            if output_dir:
+                with open(out_path / f"result_{i:03d}.json", 'w', encoding='utf-8') as f:
+                    f.write(result.to_json())
+
+            if verbose:
+                click.echo(f"✅ Prompt {i}: confidence {result.integrated_confidence:.3f}")
+
+        click.echo(f"📊 Batch completed: {succeeded}/{len(prompts)} succeeded")
+        if output_dir:
+            click.echo(f"💾 Results saved to: {output_dir}")
+
+    except Exception as e:
+        click.echo(f"❌ Batch analysis failed: {e}", err=True)
+        if verbose:
+            import traceback
+            click.echo(traceback.format_exc())
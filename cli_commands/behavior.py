@@ -0,0 +1,94 @@
+"""Behavioral trajectory analysis subcommand."""
+
+import asyncio
+from pathlib import Path
+from typing import Optional
+import click
+
+import utils_cache
+import utils_json
+
+
+@click.command()
+@click.option('--profile', '-p', required=True, help='User profile JSON file path or JSON string')
+@click.option('--model', '-m', default='qwen3:0.6b', help='Model name')
+@click.option('--backend', '-b', default='ollama',
+              type=click.Choice(['ollama', 'huggingface']), help='Model backend')
+@click.option('--multimodal', help='Multimodal data sources JSON file path')
+@click.option('--output', '-o', help='Output file path')
+@click.option('--report', '-r', help='Generate report file path')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def behavior(profile: str, model: str, backend: str, multimodal: Optional[str],
+             output: Optional[str], report: Optional[str], verbose: bool):
+    """Run behavioral trajectory analysis"""
+    try:
+        from deepconf_with_behavior import create_integrated_analyzer
+    except ImportError:
+        click.echo("❌ Behavioral analysis functionality unavailable, please check if extensions/behavior_analysis is properly installed", err=True)
+        return
+
+    if verbose:
+        click.echo(f"🎯 Starting behavioral analysis...")
+        click.echo(f"   Model: {model}")
+        click.echo(f"   Backend: {backend}")
+
+    try:
+        # Parse user profile (file-backed profiles are cached by mtime+size)
+        profile_data = utils_cache.load_profile(profile)
+
+        # Parse multimodal data sources
+        multimodal_data = None
+        if multimodal:
+            multimodal_data = utils_json.load_multimodal(multimodal)
+
+        # Create analyzer
+        analyzer = create_integrated_analyzer(
+            model_backend=backend,
+            model_name=model
+        )
+
+        # Execute analysis
+        async def run_analysis():
+            result = await analyzer.analyze_behavior(
+                profile_data=profile_data,
+                multimodal_sources=multimodal_data
+            )
+            return result
+
+        result = asyncio.run(run_analysis())
+
+        # Serialize once; the same bytes back both the output file and
+        # the report body
+        serialized = None
+        if output or (report and result.get('status') == 'success'):
+            serialized = utils_json.dumps_bytes(result)
+
+        # Output results
+        if output:
+            Path(output).write_bytes(serialized)
+            click.echo(f"✅ Results saved to: {output}")
+
+        # Generate report
+        if report and result.get('status') == 'success':
+            header = f"""# Behavioral Trajectory Analysis Report
+
+## Analysis Overview
+- Analysis Status: {result['status']}
+- Path Count: {len(result.get('paths', []))}
+- Average Confidence: {result.get('confidence', 0):.3f}
+
+## Detailed Results
+"""
+            Path(report).write_bytes(header.encode('utf-8') + serialized + b'\n')
+            click.echo(f"📄 Report saved to: {report}")
+
+        if verbose:
+            click.echo("📊 Analysis completed")
+            click.echo(f"   Status: {result.get('status', 'unknown')}")
+            click.echo(f"   Confidence: {result.get('confidence', 0):.3f}")
+
+    except Exception as e:
+        click.echo(f"❌ Analysis failed: {e}", err=True)
+        if verbose:
+            import traceback
+            click.echo(traceback.format_exc())
@@ -0,0 +1,104 @@
+"""Integrated DeepConf + behavioral analysis subcommand."""
+
+import asyncio
+from typing import Optional
+import click
+
+import utils_cache
+import utils_json
+
+
+@click.command()
+@click.option('--prompt', '-p', required=True, help='Analysis prompt')
+@click.option('--profile', required=True, help='User profile JSON file path or JSON string')
+@click.option('--model', '-m', default='qwen3:0.6b', help='Model name')
+@click.option('--backend', '-b', default='ollama',
+              type=click.Choice(['ollama', 'huggingface']), help='Model backend')
+@click.option('--multimodal', help='Multimodal data sources JSON file path')
+@click.option('--output', '-o', help='Output file path')
+@click.option('--report', '-r', help='Generate report file path')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def integrated(prompt: str, profile: str, model: str, backend: str,
+               multimodal: Optional[str], output: Optional[str],
+               report: Optional[str], verbose: bool):
+    """Run integrated analysis (DeepConf + Behavioral Analysis)"""
+    try:
+        from deepconf_with_behavior import create_integrated_analyzer
+    except ImportError:
+        click.echo("❌ Integrated analysis functionality unavailable, please check related dependencies", err=True)
+        return
+
+    if verbose:
+        click.echo(f"🔄 Starting integrated analysis...")
+        click.echo(f"   Prompt: {prompt[:50]}...")
+        click.echo(f"   Model: {model}")
+        click.echo(f"   Backend: {backend}")
+
+    try:
+        # Execute integrated analysis
+        async def run_analysis():
+            # File reads run in worker threads while the analyzer (and
+            # its model) is constructed on the main thread, hiding read
+            # latency behind model init
+            profile_task = asyncio.create_task(
+                asyncio.to_thread(utils_cache.load_profile, profile))
+            multimodal_task = None
+            if multimodal:
+                multimodal_task = asyncio.create_task(
+                    asyncio.to_thread(utils_json.load_multimodal, multimodal))
+
+            analyzer = create_integrated_analyzer(
+                model_backend=backend,
+                model_name=model
+            )
+
+            profile_data = await profile_task
+            multimodal_data = await multimodal_task if multimodal_task else None
+
+            try:
+                analysis = await analyzer.integrated_analysis(
+                    prompt=prompt,
+                    profile_data=profile_data,
+                    multimodal_sources=multimodal_data
+                )
+                # Render the report before the analyzer is closed; the
+                # outer function only writes the finished string
+                rendered = (analyzer.generate_integrated_report(analysis)
+                            if report else None)
+                return analysis, rendered
+            finally:
+                await analyzer.aclose()
+
+        result, report_content = asyncio.run(run_analysis())
+
+        # Output results
+        if output:
+            # Serialize field by field so the large deepconf_result is
+            # the only value buffered at once, not the whole document
+            utils_json.dump_keys((
+                ('deepconf_result', result.deepconf_result),
+                ('deepconf_confidence', result.deepconf_confidence),
+                ('behavior_result', result.behavior_result),
+                ('integrated_confidence', result.integrated_confidence),
+                ('analysis_consistency', result.analysis_consistency),
+                ('recommendation_score', result.recommendation_score),
+            ), output)
+            click.echo(f"✅ Results saved to: {output}")
+
+        # Generate report
+        if report:
+            with open(report, 'w', encoding='utf-8') as f:
+                f.write(report_content)
+            click.echo(f"📄 Report saved to: {report}")
+
+        if verbose:
+            click.echo("📊 Integrated analysis completed")
+            click.echo(f"   Integrated Confidence: {result.integrated_confidence:.3f}")
+            click.echo(f"   Analysis Consistency: {result.analysis_consistency:.3f}")
+            click.echo(f"   Recommendation Score: {result.recommendation_score:.3f}")
+
+    except Exception as e:
+        click.echo(f"❌ Integrated analysis failed: {e}", err=True)
+        if verbose:
+            import traceback
+            click.echo(traceback.format_exc())
@@ -0,0 +1,64 @@
+"""Interactive analysis session subcommand."""
+
+import asyncio
+import click
+
+import utils_cache
+
+
+@click.command()
+@click.option('--profile', '-p', required=True, help='User profile JSON file path or JSON string')
+@click.option('--model', '-m', default='qwen3:0.6b', help='Model name')
+@click.option('--backend', '-b', default='ollama',
+              type=click.Choice(['ollama', 'huggingface']), help='Model backend')
+def repl(profile: str, model: str, backend: str):
+    """Interactive session reusing one analyzer across prompts"""
+    try:
+        from deepconf_with_behavior import create_integrated_analyzer
+    except ImportError:
+        click.echo("❌ Integrated analysis functionality unavailable, please check related dependencies", err=True)
+        return
+
+    try:
+        # Parse user profile (file-backed profiles are cached by mtime+size)
+        profile_data = utils_cache.load_profile(profile)
+
+        # The analyzer (and its loaded model) persists for the whole
+        # session; each prompt only pays inference time
+        analyzer = create_integrated_analyzer(
+            model_backend=backend,
+            model_name=model
+        )
+
+        click.echo(f"🧠 DeepConf REPL ({backend}:{model}) - type 'exit' or Ctrl-D to quit")
+
+        while True:
+            try:
+                prompt = click.prompt('deepconf> ', prompt_suffix='')
+            except (click.Abort, EOFError):
+                click.echo()
+                break
+
+            if prompt.strip().lower() in ('exit', 'quit'):
+                break
+            if not prompt.strip():
+                continue
+
+            try:
+                result = asyncio.run(analyzer.integrated_analysis(
+                    prompt=prompt,
+                    profile_data=profile_data
+                ))
+
+                click.echo(f"   Integrated Confidence: {result.integrated_confidence:.3f}")
+                click.echo(f"   Analysis Consistency: {result.analysis_consistency:.3f}")
+                click.echo(f"   Recommendation Score: {result.recommendation_score:.3f}")
+
+            except Exception as e:
+                click.echo(f"❌ Analysis failed: {e}", err=True)
+
+        asyncio.run(analyzer.aclose())
+        click.echo("👋 Session closed")
+
+    except Exception as e:
+        click.echo(f"❌ REPL failed: {e}", err=True)
@@ -0,0 +1,82 @@
+"""Single DeepConf reasoning subcommand."""
+
+from typing import Optional
+import click
+import numpy as np
+
+import utils_json
+
+
+def _mean(values) -> float:
+    """Vectorized mean of a confidence sequence; 0.0 when empty."""
+    arr = np.asarray(values, dtype=np.float32)
+    return float(arr.mean()) if arr.size else 0.0
+
+
+@click.command()
+@click.option('--prompt', '-p', required=True, help='Input prompt')
+@click.option('--model', '-m', default='qwen3:0.6b', help='Model name')
+@click.option('--backend', '-b', default='ollama',
+              type=click.Choice(['ollama', 'huggingface']), help='Model backend')
+@click.option('--num-paths', '-n', default=8, help='Number of paths to generate')
+@click.option('--keep-ratio', '-k', default=0.8, help='Path keep ratio')
+@click.option('--mode', default='offline',
+              type=click.Choice(['offline', 'online']), help='Execution mode')
+@click.option('--output', '-o', help='Output file path')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def run(prompt: str, model: str, backend: str, num_paths: int,
+        keep_ratio: float, mode: str, output: Optional[str], verbose: bool):
+    """Run single DeepConf reasoning task"""
+    # deepconf_complete drags the model stack; import only when this
+    # command actually runs
+    from deepconf_complete import create_deepconf_runner, DeepConfConfig
+
+    if verbose:
+        click.echo(f"🚀 Starting DeepConf...")
+        click.echo(f"   Prompt: {prompt[:50]}...")
+        click.echo(f"   Model: {model}")
+        click.echo(f"   Backend: {backend}")
+        click.echo(f"   Paths: {num_paths}")
+        click.echo(f"   Keep ratio: {keep_ratio}")
+        click.echo(f"   Mode: {mode}")
+
+    try:
+        # Create configuration
+        config = DeepConfConfig(
+            num_paths=num_paths,
+            keep_ratio=keep_ratio
+        )
+
+        # Create runner
+        runner = create_deepconf_runner(
+            backend_type=backend,
+            model_path=model,
+            config=config
+        )
+
+        # Execute reasoning
+        if mode == 'offline':
+            result = runner.run_offline(prompt)
+        else:
+            result = runner.run_online(prompt)
+
+        # Output results
+        if output:
+            utils_json.dump(result, output)
+            click.echo(f"✅ Results saved to: {output}")
+
+        if verbose:
+            click.echo("📊 Reasoning completed")
+            click.echo(f"   Final answer: {result['final_answer'][:100]}...")
+            click.echo(f"   Generated paths: {len(result['all_paths'])}")
+            click.echo(f"   Kept paths: {len(result['kept_paths'])}")
+            click.echo(f"   Average confidence: {_mean(result['kept_confidences']):.3f}")
+        else:
+            click.echo("✅ Reasoning completed")
+            click.echo(f"Final answer: {result['final_answer']}")
+
+    except Exception as e:
+        click.echo(f"❌ Reasoning failed: {e}", err=True)
+        if verbose:
+            import traceback
+            click.echo(traceback.format_exc())
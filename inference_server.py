@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Micro-batching inference server
+===============================
+
+Coalesces individually submitted prompts into micro-batches for a
+batched model backend. Callers await ``submit(prompt)``; a background
+coroutine drains the request queue into batches bounded by a maximum
+size and a collection timeout, issues one batched backend call, and
+routes each response back to its waiting caller. Batching amortizes
+kernel-launch and weight-access cost across requests, which is the
+dominant overhead when many small generation calls hit the same model.
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceServer:
+    """
+    Shared micro-batching front end for a batched generation backend.
+
+    Args:
+        generate_batch: Callable taking a list of prompts and returning
+            a list of outputs in the same order. May be sync (run in a
+            worker thread) or async.
+        max_batch_size: Largest micro-batch dispatched in one call.
+        batch_timeout: Seconds to wait for more requests after the first
+            one arrives before dispatching a partial batch.
+    """
+
+    def __init__(self, generate_batch, max_batch_size: int = 16, batch_timeout: float = 0.02):
+        self._generate_batch = generate_batch
+        self.max_batch_size = max_batch_size
+        self.batch_timeout = batch_timeout
+        self._queue = None
+        self._server_task = None
+        self._loop = None
+
+    async def submit(self, prompt):
+        """Submit one prompt and wait for its generated output."""
+        self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, future))
+        return await future
+
+    async def close(self):
+        """Stop the server loop; pending requests are cancelled."""
+        if self._server_task is not None:
+            self._server_task.cancel()
+            # Only await the task from the loop it belongs to; a
+            # different (or already finished) loop cannot join it
+            if self._loop is not None and self._loop is asyncio.get_running_loop():
+                try:
+                    await self._server_task
+                except asyncio.CancelledError:
+                    pass
+            self._server_task = None
+        self._cancel_pending()
+        self._queue = None
+        self._loop = None
+
+    def _ensure_running(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # asyncio.Queue latches onto the first loop that touches
+            # it; callers arriving from a new asyncio.run() (e.g. the
+            # REPL issues one per prompt) need a fresh queue and server
+            # task bound to their loop
+            self._cancel_pending()
+            if self._server_task is not None:
+                self._server_task.cancel()
+                self._server_task = None
+            self._queue = asyncio.Queue()
+            self._loop = loop
+        if self._server_task is None or self._server_task.done():
+            self._server_task = loop.create_task(self._serve())
+
+    def _cancel_pending(self):
+        """Cancel futures still waiting in the queue so their
+        submitters never hang."""
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            try:
+                if not future.done():
+                    future.cancel()
+            except RuntimeError:
+                # Future belongs to a loop that is already closed
+                pass
+
+    async def _collect_batch(self):
+        """Block for the first request, then gather more until the batch
+        is full or the collection timeout elapses."""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_timeout
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _serve(self):
+        while True:
+            batch = await self._collect_batch()
+            prompts = [prompt for prompt, _ in batch]
+
+            try:
+                if asyncio.iscoroutinefunction(self._generate_batch):
+                    outputs = await self._generate_batch(prompts)
+                else:
+                    outputs = await asyncio.to_thread(self._generate_batch, prompts)
+            except Exception as e:
+                logger.error("Batched generation failed for %d prompts: %s", len(prompts), e)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
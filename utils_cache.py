@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+On-disk caches for repeated CLI runs.
+
+The same profile file is typically passed to dozens of invocations in
+batch workflows; caching the parsed object keyed by the file's identity
+(path, mtime, size) turns every repeat load into a single pickle read.
+"""
+
+import hashlib
+import logging
+import pickle
+from pathlib import Path
+
+import utils_json
+
+logger = logging.getLogger(__name__)
+
+PROFILE_CACHE_DIR = Path.home() / '.cache' / 'deepconf' / 'profiles'
+
+CLI_HELP_CACHE = Path.home() / '.cache' / 'deepconf' / 'clihelp.pkl'
+
+
+def load_cli_help(key):
+    """Return the cached {command: short_help} table for key, or None.
+
+    The key encodes the subcommand files' identities (path, mtime,
+    size), so any edit to a command module invalidates the table.
+    """
+    try:
+        with open(CLI_HELP_CACHE, 'rb') as f:
+            cached_key, help_map = pickle.load(f)
+        if cached_key == key:
+            return help_map
+    except (OSError, pickle.PickleError, ValueError, EOFError) as e:
+        logger.debug("CLI help cache lookup failed: %s", e)
+    return None
+
+
+def store_cli_help(key, help_map):
+    """Persist the {command: short_help} table under key."""
+    try:
+        CLI_HELP_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CLI_HELP_CACHE, 'wb') as f:
+            pickle.dump((key, help_map), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.debug("CLI help cache store failed: %s", e)
+
+
+def _profile_cache_path(path: Path, stat) -> Path:
+    """Cache file location for a profile at a given (mtime, size)."""
+    key = f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')
+    return PROFILE_CACHE_DIR / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.pkl"
+
+
+def load_profile(profile: str):
+    """
+    Load a user profile from a JSON string or file path.
+
+    File-backed profiles are cached under ~/.cache/deepconf/profiles
+    keyed by (absolute path, mtime_ns, size), so unchanged files skip
+    JSON parsing entirely on repeat runs. Inline JSON strings (starting
+    with '{') are parsed directly and never cached.
+    """
+    if profile.startswith('{'):
+        return utils_json.loads(profile)
+
+    path = Path(profile).resolve()
+    cache_path = None
+    try:
+        cache_path = _profile_cache_path(path, path.stat())
+        if cache_path.exists():
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.PickleError) as e:
+        logger.debug("Profile cache lookup failed for %s: %s", path, e)
+
+    profile_data = utils_json.load_bytes(path)
+
+    if cache_path is not None:
+        try:
+            PROFILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(profile_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug("Profile cache store failed for %s: %s", path, e)
+
+    return profile_data
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+JSON helpers shared by the CLI and analysis modules.
+
+Wraps orjson (a C extension that parses and serializes several times
+faster than stdlib json and emits UTF-8 bytes directly) behind small
+load/dump functions, falling back to the stdlib encoder when orjson is
+not installed.
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson streams large documents incrementally; its import picks the
+# fastest installed backend (yajl2_c when available)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+if orjson is not None:
+    # OPT_SERIALIZE_NUMPY writes numpy arrays straight from their
+    # buffers, so callers never need .tolist() materialization;
+    # OPT_NON_STR_KEYS coerces int/float dict keys like stdlib json
+    # does, keeping both code paths semantically identical
+    _DUMPS_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    _DUMP_OPTS = _DUMPS_OPTS | orjson.OPT_INDENT_2
+
+
+def loads(data):
+    """Parse JSON from a str or bytes payload"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def load_bytes(path):
+    """Load a JSON file via its raw bytes"""
+    return loads(Path(path).read_bytes())
+
+
+def load_multimodal(path):
+    """Load a multimodal JSON source, streaming top-level arrays.
+
+    Array-shaped files (the common shape for per-modality record logs)
+    are parsed incrementally via ijson so peak memory stays near one
+    item instead of ~10x the file size; anything else falls back to a
+    full load.
+    """
+    path = Path(path)
+    with open(path, 'rb') as f:
+        head = f.read(64).lstrip()
+    if ijson is not None and head[:1] == b'[':
+        with open(path, 'rb') as f:
+            return list(ijson.items(f, 'item'))
+    return load_bytes(path)
+
+
+def dumps(obj) -> str:
+    """Serialize obj to a compact JSON string (one line, JSONL-safe)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_DUMPS_OPTS, default=str).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+def dumps_indent(obj) -> str:
+    """Pretty-print obj as a JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_DUMP_OPTS, default=str).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=str)
+
+
+def dumps_bytes(obj) -> bytes:
+    """Pretty-print obj as UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_DUMP_OPTS, default=str)
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+
+
+def dump_keys(pairs, path):
+    """Write a JSON object to path one key at a time.
+
+    Each value is serialized and written independently, so peak memory
+    is one serialized value instead of the whole document — relevant
+    when a single field (e.g. thousands of reasoning paths) dominates
+    the result.
+    """
+    with open(path, 'wb') as f:
+        f.write(b'{\n')
+        first = True
+        for key, value in pairs:
+            if not first:
+                f.write(b',\n')
+            first = False
+            f.write(b'"' + key.encode('utf-8') + b'": ')
+            f.write(dumps_bytes(value))
+        f.write(b'\n}\n')
+
+
+def dump(obj, path):
+    """Write obj as pretty-printed UTF-8 JSON to path"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=_DUMP_OPTS, default=str))
+    else:
+        Path(path).write_text(
+            json.dumps(obj, ensure_ascii=False, indent=2, default=str),
+            encoding='utf-8'
+        )